@@ -2,13 +2,147 @@ import requests
 import json
 import argparse
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+import hashlib
+import logging
 import os
+import re
+import sys
+import tempfile
+import time
 import urllib3
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+logger = logging.getLogger('datasight')
+
+# Default location of the on-disk HTTP response cache (enabled in the CLI by DATASIGHT_CACHE=1)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'datasight', 'responses')
+
+# Cache entries not refreshed within this many seconds (30 days) are deleted
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# (connect, read) timeout in seconds for every DataSight request; a timed-out
+# request is retried like other transient failures
+REQUEST_TIMEOUT = (10, 30)
+
+# Default upper bound on concurrent detail-record requests against the DataSight gateway
+MAX_DETAIL_WORKERS = 8
+
+# Metric key -> (endpoint path, display name) for the four DORA metrics
+METRICS = {
+    'release_frequency': ('/releases/metric/release-frequency/teambook/metric', 'Release Frequency'),
+    'lttd': ('/releases/metric/lttd/teambook/metric', 'Lead Time to Deploy (LTTD)'),
+    'mttr': ('/incident/metric/mttr/by-service/teambook/metric', 'Mean Time to Recovery (MTTR)'),
+    'cfr': ('/releases/metric/cfr/teambook/metric', 'Change Failure Rate (CFR)')
+}
+
+# Write buffer for CSV reports (1 MiB) to keep the number of write() calls low
+CSV_BUFFER_SIZE = 1 << 20
+
+# (CSV header, API field) pairs for each section of the DORA metrics report
+RELEASE_FREQUENCY_SCHEMA = (
+    ('Year-Month', 'yearMonth'),
+    ('Releases', 'releases'),
+    ('Software Releases %', 'percent_software_releases'),
+    ('PDPTPPY (Calendar)', 'pdptppy_calendar_days'),
+    ('PDPTPPY (Headcount)', 'pdptppy_full_headcount_basis'),
+    ('Head Count', 'head_count'),
+    ('IT Head Count', 'it_head_count'),
+    ('Pods Count', 'pods_count'),
+    ('L1 Teambook', 'l1_teambook'),
+    ('L2 Teambook', 'l2_teambook'),
+    ('L3 Teambook', 'l3_teambook')
+)
+
+LTTD_SCHEMA = (
+    ('Year-Month', 'yearMonth'),
+    ('LTTD (days)', 'lttd'),
+    ('Highest LTTD', 'highest_lttd'),
+    ('CRs with LTTD', 'crs_with_lttd'),
+    ('Eligible CRs', 'eligible_crs'),
+    ('CRs with LTTD %', 'percent_crs_with_lttd'),
+    ('Pods with CRs', 'pods_with_crs'),
+    ('Pods with LTTD', 'pods_with_lttd'),
+    ('Pods with LTTD < Week', 'pods_with_lttd_less_than_week'),
+    ('Pods with LTTD < Week %', 'percent_pods_with_lttd_less_than_week'),
+    ('L1 Teambook', 'l1_teambook'),
+    ('L2 Teambook', 'l2_teambook'),
+    ('L3 Teambook', 'l3_teambook'),
+    ('Agg Key', 'aggKey')
+)
+
+MTTR_SCHEMA = (
+    ('Year-Month', 'yearMonth'),
+    ('MTTR (hours)', 'mttr'),
+    ('MTTR CHM (hours)', 'mttr_chm'),
+    ('Incidents Count', 'incidents_count'),
+    ('Incidents Count CHM', 'incidents_count_chm'),
+    ('Non-Incidents %', 'non_incidents_percent'),
+    ('L1 Teambook', 'l1_teambook'),
+    ('L2 Teambook', 'l2_teambook'),
+    ('L3 Teambook', 'l3_teambook'),
+    ('Agg Key', 'aggKey')
+)
+
+CFR_SCHEMA = (
+    ('Year-Month', 'yearMonth'),
+    ('Change Failure Rate %', 'change_failure_rate'),
+    ('Change Causing Incident %', 'percent_change_causing_incident'),
+    ('Change with Business Impact %', 'percent_change_with_business_impact'),
+    ('Releases', 'releases'),
+    ('Change Failed', 'change_failed'),
+    ('Change Causing Incident', 'change_causing_incident'),
+    ('Change with Business Impact', 'change_with_business_impact'),
+    ('Pods Count', 'num_of_pods_current_month'),
+    ('Pod IT HC', 'pod_it_hc_current_month'),
+    ('L1 Teambook', 'l1_teambook'),
+    ('L2 Teambook', 'l2_teambook'),
+    ('L3 Teambook', 'l3_teambook'),
+    ('Agg Key', 'aggKey')
+)
+
+# (section title, metric key, schema) for each section of the DORA metrics report
+CSV_SECTIONS = (
+    ('RELEASE FREQUENCY', 'release_frequency', RELEASE_FREQUENCY_SCHEMA),
+    ('LEAD TIME TO DEPLOY (LTTD)', 'lttd', LTTD_SCHEMA),
+    ('MEAN TIME TO RECOVERY (MTTR)', 'mttr', MTTR_SCHEMA),
+    ('CHANGE FAILURE RATE (CFR)', 'cfr', CFR_SCHEMA)
+)
+
+# (CSV header, API field) pairs for the filtered LTTD report; the leading
+# Month-Year column is derived from the month and year fields.
+FILTERED_LTTD_SCHEMA = (
+    ('Change Reference', 'id'),
+    ('Start Date', 'start_date'),
+    ('Replica Item', 'short_description'),
+    ('Applicant Group', 'requested_by'),
+    ('Assign Group', 'assignment_group'),
+    ('Report Group', 'l3_business_unit'),
+    ('DTT (17 Pod)', 'l4_business_unit'),
+    ('Requested By', 'requested_by'),
+    ('LTTD Days (Inc. Weekends-numeric)', 'lead_time_to_deploy_numeric_days'),
+    ('CR Processing Hurdle', 'cr_processing_hurdle'),
+    ('ICE CR Link', 'ice_cr_link'),
+    ('CR First Commit URL', 'cr_first_commit_url'),
+    ('Commits URL Call', 'commits_url_call'),
+    ('Source Code Diff URL', 'source_code_diff_URL'),
+    ('CR First Commit Time', 'cr_first_commit_time'),
+    ('Actual End Date Time', 'actual_end_date_time'),
+    ('Repo Link', 'repo_link')
+)
+
 
 class DataSightDORAFetcher:
     """
@@ -16,26 +150,195 @@ class DataSightDORAFetcher:
     Supports: Release Frequency, Lead Time for Changes (LTTD), Change Failure Rate (CFR), Mean Time to Recovery (MTTR)
     """
     
-    def __init__(self, base_url: str, bearer_token: str):
+    # Repository host detection and (commits URL, diff URL) templates per host
+    _PROVIDER_RE = re.compile(r'github|gitlab|bitbucket', re.IGNORECASE)
+    _URL_TEMPLATES = {
+        'github': ('{repo}/commit/{commit}', '{repo}/commit/{commit}.diff'),
+        'gitlab': ('{repo}/-/commit/{commit}', '{repo}/-/commit/{commit}.diff'),
+        'bitbucket': ('{repo}/commits/{commit}', '{repo}/diff/{commit}'),
+        None: ('{repo}/commit/{commit}', '{repo}/diff/{commit}')
+    }
+    
+    def __init__(self, base_url: str, bearer_token: str, cache_dir: Optional[str] = None,
+                 max_workers: int = MAX_DETAIL_WORKERS):
         """
         Initialize the DataSight DORA metrics fetcher.
         
         Args:
             base_url: Base URL for DataSight API (e.g., https://datasight.global.hsbc)
             bearer_token: Bearer token for authorization
+            cache_dir: Directory for the ETag/Last-Modified response cache (disabled if None)
+            max_workers: Maximum number of concurrent detail-record requests
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
         self.base_url = base_url.rstrip('/')
+        self.max_workers = max_workers
         self.headers = {
             'Authorization': f'Bearer {bearer_token}',
             'Content-Type': 'application/json'
         }
+        
+        # One pooled session so repeated calls reuse the same TCP/TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Advertise every encoding urllib3 can decode here (gzip, deflate and br when
+        # brotli is installed) so the JSON payloads travel compressed.
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self.session.verify = False
+        # Transient failures (rate limiting, gateway errors, dropped connections) are
+        # retried with exponential backoff; 4xx client errors fail immediately.
+        retry = Retry(
+            total=5,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(32, max_workers), max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Responses carrying ETag/Last-Modified are kept on disk and revalidated with
+        # conditional requests, so unchanged data is not downloaded again.
+        self.cache_dir = cache_dir
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError:
+                self.cache_dir = None
+            else:
+                self._prune_cache()
+        
+        # Successful metric responses keyed by (metric key, query parameters)
+        self._metric_cache: Dict[tuple, Dict] = {}
+        # Successful detail-record responses keyed by (agg_key, page, size)
+        self._detail_cache: Dict[tuple, Dict] = {}
     
-    def fetch_release_frequency(self, from_date: str, to_date: str, teambook_ids: str, 
-                                teambook_level: int, page: int = 1, size: int = 50) -> Dict:
+    def close(self):
+        """Close the pooled HTTP session and release its keep-alive connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _get(self, endpoint: str, params: Dict, metric_name: Optional[str] = None) -> Dict:
         """
-        Fetch Release Frequency metric.
+        Issue a GET request on the shared session and wrap the result.
         
         Args:
+            endpoint: Full endpoint URL
+            params: Query parameters
+            metric_name: Metric label included in the result (omitted if None)
+            
+        Returns:
+            Dictionary with status, data and (on failure) error
+        """
+        result = {'metric': metric_name} if metric_name else {}
+        cache_path = self._cache_path(endpoint, params) if self.cache_dir else None
+        cached = self._read_cached_response(cache_path) if cache_path else None
+        
+        conditional_headers = {}
+        if cached:
+            if cached.get('etag'):
+                conditional_headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = cached['last_modified']
+        
+        try:
+            response = self.session.get(endpoint, params=params, headers=conditional_headers,
+                                        timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304 and cached:
+                # Still current: refresh the entry's age so pruning keeps it
+                try:
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                result['status'] = 'success'
+                result['data'] = cached['body']
+                return result
+            
+            response.raise_for_status()
+            result['status'] = 'success'
+            result['data'] = orjson.loads(response.content) if orjson else response.json()
+            
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if cache_path and (etag or last_modified):
+                self._write_cached_response(cache_path, {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'body': result['data']
+                })
+        except (requests.exceptions.RequestException, ValueError) as e:
+            result['status'] = 'error'
+            result['error'] = str(e)
+            result['data'] = None
+        return result
+    
+    def _prune_cache(self):
+        """Delete cache entries (and leftover temp files) older than CACHE_MAX_AGE."""
+        cutoff = time.time() - CACHE_MAX_AGE
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return
+        for entry in entries:
+            if not entry.name.endswith(('.json', '.tmp')):
+                continue
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+    
+    def _cache_path(self, endpoint: str, params: Dict) -> str:
+        """Path of the on-disk response cache entry for a request."""
+        request_key = f"{endpoint}?{urlencode(sorted(params.items()))}"
+        digest = hashlib.blake2b(request_key.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    @staticmethod
+    def _read_cached_response(cache_path: str) -> Optional[Dict]:
+        """Load a cached response entry, or None if it is missing, unreadable or malformed."""
+        try:
+            with open(cache_path, 'rb') as f:
+                content = f.read()
+            entry = orjson.loads(content) if orjson else json.loads(content)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or 'body' not in entry:
+            return None
+        return entry
+    
+    @staticmethod
+    def _write_cached_response(cache_path: str, entry: Dict):
+        """Atomically write a cached response entry; failures are ignored."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(entry) if orjson else json.dumps(entry).encode('utf-8'))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    
+    def _fetch_metric(self, key: str, from_date: str, to_date: str, teambook_ids: str,
+                      teambook_level: int, page: int = 1, size: int = 50) -> Dict:
+        """
+        Fetch one of the DORA metrics listed in METRICS.
+        
+        Args:
+            key: Metric key in METRICS (release_frequency, lttd, mttr or cfr)
             from_date: Start date (format: YYYY-MM)
             to_date: End date (format: YYYY-MM)
             teambook_ids: Teambook IDs (comma-separated)
@@ -44,9 +347,14 @@ class DataSightDORAFetcher:
             size: Page size
             
         Returns:
-            API response as dictionary
+            API response as dictionary (successful responses are memoized per fetcher)
         """
-        endpoint = f"{self.base_url}/releases/metric/release-frequency/teambook/metric"
+        cache_key = (key, from_date, to_date, teambook_ids, teambook_level, page, size)
+        if cache_key in self._metric_cache:
+            return self._metric_cache[cache_key]
+        
+        path, label = METRICS[key]
+        endpoint = f"{self.base_url}{path}"
         params = {
             'from': from_date,
             'to': to_date,
@@ -56,22 +364,29 @@ class DataSightDORAFetcher:
             'size': size
         }
         
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=False)
-            response.raise_for_status()
-            result = response.json()
-            return {
-                'metric': 'Release Frequency',
-                'status': 'success',
-                'data': result
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                'metric': 'Release Frequency',
-                'status': 'error',
-                'error': str(e),
-                'data': None
-            }
+        result = self._get(endpoint, params, label)
+        if result['status'] == 'success':
+            self._metric_cache[cache_key] = result
+        return result
+    
+    def fetch_release_frequency(self, from_date: str, to_date: str, teambook_ids: str, 
+                                teambook_level: int, page: int = 1, size: int = 50) -> Dict:
+        """
+        Fetch Release Frequency metric.
+        
+        Args:
+            from_date: Start date (format: YYYY-MM)
+            to_date: End date (format: YYYY-MM)
+            teambook_ids: Teambook IDs (comma-separated)
+            teambook_level: Teambook level (1-5)
+            page: Page number
+            size: Page size
+            
+        Returns:
+            API response as dictionary
+        """
+        return self._fetch_metric('release_frequency', from_date, to_date, teambook_ids,
+                                  teambook_level, page, size)
     
     def fetch_lttd(self, from_date: str, to_date: str, teambook_ids: str, 
                    teambook_level: int, page: int = 1, size: int = 50) -> Dict:
@@ -89,32 +404,8 @@ class DataSightDORAFetcher:
         Returns:
             API response as dictionary
         """
-        endpoint = f"{self.base_url}/releases/metric/lttd/teambook/metric"
-        params = {
-            'from': from_date,
-            'to': to_date,
-            'teambookIds': teambook_ids,
-            'teambookLevel': teambook_level,
-            'page': page,
-            'size': size
-        }
-        
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=False)
-            response.raise_for_status()
-            result = response.json()
-            return {
-                'metric': 'Lead Time to Deploy (LTTD)',
-                'status': 'success',
-                'data': result
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                'metric': 'Lead Time to Deploy (LTTD)',
-                'status': 'error',
-                'error': str(e),
-                'data': None
-            }
+        return self._fetch_metric('lttd', from_date, to_date, teambook_ids,
+                                  teambook_level, page, size)
     
     def fetch_mttr(self, from_date: str, to_date: str, teambook_ids: str, 
                    teambook_level: int, page: int = 1, size: int = 50) -> Dict:
@@ -132,32 +423,8 @@ class DataSightDORAFetcher:
         Returns:
             API response as dictionary
         """
-        endpoint = f"{self.base_url}/incident/metric/mttr/by-service/teambook/metric"
-        params = {
-            'from': from_date,
-            'to': to_date,
-            'teambookIds': teambook_ids,
-            'teambookLevel': teambook_level,
-            'page': page,
-            'size': size
-        }
-        
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=False)
-            response.raise_for_status()
-            result = response.json()
-            return {
-                'metric': 'Mean Time to Recovery (MTTR)',
-                'status': 'success',
-                'data': result
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                'metric': 'Mean Time to Recovery (MTTR)',
-                'status': 'error',
-                'error': str(e),
-                'data': None
-            }
+        return self._fetch_metric('mttr', from_date, to_date, teambook_ids,
+                                  teambook_level, page, size)
     
     def fetch_cfr(self, from_date: str, to_date: str, teambook_ids: str, 
                   teambook_level: int, page: int = 1, size: int = 50) -> Dict:
@@ -175,36 +442,13 @@ class DataSightDORAFetcher:
         Returns:
             API response as dictionary
         """
-        endpoint = f"{self.base_url}/releases/metric/cfr/teambook/metric"
-        params = {
-            'from': from_date,
-            'to': to_date,
-            'teambookIds': teambook_ids,
-            'teambookLevel': teambook_level,
-            'page': page,
-            'size': size
-        }
-        
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=False)
-            response.raise_for_status()
-            result = response.json()
-            return {
-                'metric': 'Change Failure Rate (CFR)',
-                'status': 'success',
-                'data': result
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                'metric': 'Change Failure Rate (CFR)',
-                'status': 'error',
-                'error': str(e),
-                'data': None
-            }
+        return self._fetch_metric('cfr', from_date, to_date, teambook_ids,
+                                  teambook_level, page, size)
     
     def fetch_lttd_records(self, agg_key: str, page: int = 1, size: int = 50) -> Dict:
         """
         Fetch detailed LTTD records using aggregation key.
+        Successful responses are cached for the lifetime of the fetcher.
         
         Args:
             agg_key: Aggregation key from metric response
@@ -214,6 +458,10 @@ class DataSightDORAFetcher:
         Returns:
             API response as dictionary
         """
+        cache_key = (agg_key, page, size)
+        if cache_key in self._detail_cache:
+            return self._detail_cache[cache_key]
+        
         endpoint = f"{self.base_url}/releases/metric/lttd/teambook/records"
         params = {
             'aggKey': agg_key,
@@ -221,22 +469,34 @@ class DataSightDORAFetcher:
             'size': size
         }
         
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=False)
-            response.raise_for_status()
-            return {
-                'status': 'success',
-                'data': response.json()
-            }
-        except requests.exceptions.RequestException as e:
-            return {
-                'status': 'error',
-                'error': str(e),
-                'data': None
-            }
+        result = self._get(endpoint, params)
+        if result['status'] == 'success':
+            self._detail_cache[cache_key] = result
+        return result
+    
+    def _fetch_lttd_records_concurrently(self, agg_keys: List[str],
+                                         size: int = 50) -> Iterator[Tuple[str, Dict]]:
+        """
+        Fetch detailed LTTD records for several aggregation keys concurrently.
+        At most self.max_workers requests are in flight at any time, and a key
+        that appears more than once is only fetched once.
+        
+        Args:
+            agg_keys: Aggregation keys to fetch
+            size: Page size
+            
+        Yields:
+            (agg_key, API response) pairs in first-seen order of agg_keys
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(agg_key, executor.submit(self.fetch_lttd_records, agg_key, size=size))
+                       for agg_key in dict.fromkeys(agg_keys)]
+            for agg_key, future in futures:
+                yield agg_key, future.result()
     
     def fetch_filtered_lttd_records(self, from_date: str, to_date: str, teambook_ids: str, 
-                                    teambook_level: int, min_lttd_days: int = 15) -> List[Dict]:
+                                    teambook_level: int, min_lttd_days: int = 15,
+                                    lttd_response: Optional[Dict] = None) -> List[Dict]:
         """
         Fetch LTTD records filtered by lttd_eligible=true and LTTD days > threshold.
         
@@ -246,84 +506,93 @@ class DataSightDORAFetcher:
             teambook_ids: Teambook IDs (comma-separated)
             teambook_level: Teambook level (1-5)
             min_lttd_days: Minimum LTTD days threshold (default: 15)
+            lttd_response: Already-fetched fetch_lttd() response to reuse (optional)
             
         Returns:
-            List of filtered LTTD records with additional fields
+            List of filtered LTTD records with additional fields (commits_url,
+            source_code_diff_url)
         """
-        print(f"\nFetching LTTD records where lttd_eligible=true and LTTD > {min_lttd_days} days...")
+        logger.info(f"\nFetching LTTD records where lttd_eligible=true and LTTD > {min_lttd_days} days...")
         
-        lttd_metrics = self.fetch_lttd(from_date, to_date, teambook_ids, teambook_level)
+        lttd_metrics = lttd_response or self.fetch_lttd(from_date, to_date, teambook_ids, teambook_level)
         
         if lttd_metrics['status'] != 'success' or not lttd_metrics.get('data'):
-            print("Failed to fetch LTTD metrics")
+            logger.warning("Failed to fetch LTTD metrics")
             return []
         
         filtered_records = []
         lttd_data = lttd_metrics['data'].get('data', [])
         
-        for metric_record in lttd_data:
-            agg_key = metric_record.get('aggKey')
-            if not agg_key:
-                continue
-            
-            print(f"  Processing aggKey: {agg_key}")
-            details_response = self.fetch_lttd_records(agg_key, size=100)
+        agg_keys = [r.get('aggKey') for r in lttd_data if r.get('aggKey')]
+        
+        for agg_key, details_response in self._fetch_lttd_records_concurrently(agg_keys, size=100):
+            logger.info(f"  Processing aggKey: {agg_key}")
             
             if details_response['status'] != 'success' or not details_response.get('data'):
                 continue
             
             records = details_response['data'].get('data', [])
             
-            for record in records:
-                lttd_eligible = record.get('lttd_eligible', False)
-                lttd_days = record.get('lead_time_to_deploy_numeric_days')
-                if lttd_days is None:
-                    lttd_days = record.get('lead_time_to_deploy_days')
-                
-                if lttd_days is None:
-                    lttd_days = 0
-                
-                try:
-                    lttd_days = float(lttd_days)
-                except (ValueError, TypeError):
-                    lttd_days = 0
-                
-                if lttd_eligible and lttd_days > min_lttd_days:
-                    filtered_records.append(record)
-                    print(f"    ✓ Matched: ID={record.get('id', 'N/A')}, LTTD={lttd_days} days")
-        
-        print(f"  Found {len(filtered_records)} records matching criteria")
+            matched = [self._enrich_lttd_record(record) for record in records
+                       if record.get('lttd_eligible', False)
+                       and self._lttd_days(record) > min_lttd_days]
+            filtered_records.extend(matched)
+            if logger.isEnabledFor(logging.DEBUG):
+                for record in matched:
+                    logger.debug(f"    ✓ Matched: ID={record.get('id', 'N/A')}, LTTD={self._lttd_days(record)} days")
+        
+        logger.info(f"  Found {len(filtered_records)} records matching criteria")
         return filtered_records
     
-    def _enrich_lttd_record(self, record: Dict) -> Dict:
+    @staticmethod
+    def _lttd_days(record: Dict) -> float:
+        """
+        Get the LTTD in days for a detail record.
+        
+        Args:
+            record: LTTD detail record
+            
+        Returns:
+            Numeric LTTD days, or 0 when missing or not numeric
+        """
+        lttd_days = record.get('lead_time_to_deploy_numeric_days')
+        if lttd_days is None:
+            lttd_days = record.get('lead_time_to_deploy_days')
+        
+        try:
+            return float(lttd_days)
+        except (ValueError, TypeError):
+            return 0
+    
+    def _enrich_lttd_record(self, record: Dict, copy: bool = False) -> Dict:
         """
         Enrich LTTD record with commits URL and source code diff URL.
+        The record is updated in place unless copy is True.
         
         Args:
             record: Original LTTD record
+            copy: Enrich a shallow copy and leave the original untouched
             
         Returns:
             Enriched record with additional URL fields
         """
-        enriched = record.copy()
+        enriched = record.copy() if copy else record
+        
+        # Prefer the URLs the server already resolved over building them from repo_link
+        if record.get('cr_first_commit_url') and record.get('source_code_diff_URL'):
+            enriched['commits_url'] = record['cr_first_commit_url']
+            enriched['source_code_diff_url'] = record['source_code_diff_URL']
+            return enriched
         
-        cr_id = record.get('cr_id', '')
         repo_link = record.get('repo_link', '')
         commit_id = record.get('commit_id', '')
         
         if repo_link and commit_id:
-            if 'github' in repo_link.lower():
-                enriched['commits_url'] = f"{repo_link}/commit/{commit_id}"
-                enriched['source_code_diff_url'] = f"{repo_link}/commit/{commit_id}.diff"
-            elif 'gitlab' in repo_link.lower():
-                enriched['commits_url'] = f"{repo_link}/-/commit/{commit_id}"
-                enriched['source_code_diff_url'] = f"{repo_link}/-/commit/{commit_id}.diff"
-            elif 'bitbucket' in repo_link.lower():
-                enriched['commits_url'] = f"{repo_link}/commits/{commit_id}"
-                enriched['source_code_diff_url'] = f"{repo_link}/diff/{commit_id}"
-            else:
-                enriched['commits_url'] = f"{repo_link}/commit/{commit_id}" if commit_id else ''
-                enriched['source_code_diff_url'] = f"{repo_link}/diff/{commit_id}" if commit_id else ''
+            match = self._PROVIDER_RE.search(repo_link)
+            provider = match.group(0).lower() if match else None
+            commits_tpl, diff_tpl = self._URL_TEMPLATES[provider]
+            enriched['commits_url'] = commits_tpl.format(repo=repo_link, commit=commit_id)
+            enriched['source_code_diff_url'] = diff_tpl.format(repo=repo_link, commit=commit_id)
         else:
             enriched['commits_url'] = ''
             enriched['source_code_diff_url'] = ''
@@ -345,14 +614,17 @@ class DataSightDORAFetcher:
         Returns:
             Dictionary containing all metrics
         """
-        print(f"\n{'='*80}")
-        print(f"Fetching DORA Metrics from DataSight")
-        print(f"{'='*80}")
-        print(f"Period: {from_date} to {to_date}")
-        print(f"Teambook IDs: {teambook_ids}")
-        print(f"Teambook Level: {teambook_level}")
-        print(f"{'='*80}\n")
-        
+        logger.info(f"\n{'='*80}\n"
+                    f"Fetching DORA Metrics from DataSight\n"
+                    f"{'='*80}\n"
+                    f"Period: {from_date} to {to_date}\n"
+                    f"Teambook IDs: {teambook_ids}\n"
+                    f"Teambook Level: {teambook_level}\n"
+                    f"{'='*80}\n")
+        
+        # Each metric is a single API page and the LTTD aggKeys drive the detail
+        # fetches, so results are assembled in memory; they are also what the
+        # optional JSON export serializes.
         results = {
             'parameters': {
                 'from_date': from_date,
@@ -364,52 +636,65 @@ class DataSightDORAFetcher:
             'metrics': {}
         }
         
-        print("1. Fetching Release Frequency...")
-        release_freq = self.fetch_release_frequency(from_date, to_date, teambook_ids, teambook_level)
-        results['metrics']['release_frequency'] = release_freq
-        print(f"   Status: {release_freq['status']}")
-        if release_freq['status'] == 'success' and release_freq['data']:
-            print(f"   Records: {release_freq['data'].get('count', 0)}")
-        
-        print("\n2. Fetching Lead Time to Deploy (LTTD)...")
-        lttd = self.fetch_lttd(from_date, to_date, teambook_ids, teambook_level)
-        results['metrics']['lttd'] = lttd
-        print(f"   Status: {lttd['status']}")
-        if lttd['status'] == 'success' and lttd['data']:
-            print(f"   Records: {lttd['data'].get('count', 0)}")
-        
-        print("\n3. Fetching Mean Time to Recovery (MTTR)...")
-        mttr = self.fetch_mttr(from_date, to_date, teambook_ids, teambook_level)
-        results['metrics']['mttr'] = mttr
-        print(f"   Status: {mttr['status']}")
-        if mttr['status'] == 'success' and mttr['data']:
-            print(f"   Records: {mttr['data'].get('count', 0)}")
-        
-        print("\n4. Fetching Change Failure Rate (CFR)...")
-        cfr = self.fetch_cfr(from_date, to_date, teambook_ids, teambook_level)
-        results['metrics']['cfr'] = cfr
-        print(f"   Status: {cfr['status']}")
-        if cfr['status'] == 'success' and cfr['data']:
-            print(f"   Records: {cfr['data'].get('count', 0)}")
+        # The four metric endpoints are independent, so fetch them concurrently
+        # and report their status in a fixed order once they have all completed.
+        logger.info("Fetching Release Frequency, LTTD, MTTR and CFR...")
+        with ThreadPoolExecutor(max_workers=len(METRICS)) as executor:
+            futures = {
+                key: executor.submit(self._fetch_metric, key, from_date, to_date,
+                                     teambook_ids, teambook_level)
+                for key in METRICS
+            }
+            for key, future in futures.items():
+                results['metrics'][key] = future.result()
+        
+        for idx, (key, (_, label)) in enumerate(METRICS.items(), start=1):
+            metric = results['metrics'][key]
+            status = f"\n{idx}. {label}\n   Status: {metric['status']}"
+            if metric['status'] == 'success' and metric['data']:
+                status += f"\n   Records: {metric['data'].get('count', 0)}"
+            logger.info(status)
+        
+        lttd = results['metrics']['lttd']
         
         if fetch_details:
-            print("\n5. Fetching detailed records using aggregation keys...")
+            logger.info("\n5. Fetching detailed records using aggregation keys...")
             results['detailed_records'] = {}
             
             if lttd['status'] == 'success' and lttd['data'] and lttd['data'].get('data'):
-                for idx, record in enumerate(lttd['data']['data']):
-                    agg_key = record.get('aggKey')
-                    if agg_key:
-                        print(f"   Fetching details for aggKey: {agg_key}")
-                        details = self.fetch_lttd_records(agg_key)
-                        results['detailed_records'][agg_key] = details
+                agg_keys = [r.get('aggKey') for r in lttd['data']['data'] if r.get('aggKey')]
+                for agg_key, details in self._fetch_lttd_records_concurrently(agg_keys):
+                    logger.info(f"   Fetching details for aggKey: {agg_key}")
+                    results['detailed_records'][agg_key] = details
         
-        print(f"\n{'='*80}")
-        print("All metrics fetched successfully!")
-        print(f"{'='*80}\n")
+        logger.info(f"\n{'='*80}\nAll metrics fetched successfully!\n{'='*80}\n")
         
         return results
     
+    @staticmethod
+    def _write_section(f, title: str, schema: Tuple[Tuple[str, str], ...], section: Dict):
+        """
+        Write one metric section of the DORA CSV report.
+        
+        Args:
+            f: Open CSV file
+            title: Section title
+            schema: (CSV header, API field) pairs for the section
+            section: Metric response as returned by the fetch methods
+        """
+        writer = csv.writer(f)
+        writer.writerow(['='*20 + f' {title} ' + '='*20])
+        writer.writerow([])
+        if section['status'] == 'success' and section['data']:
+            section_data = section['data'].get('data', [])
+            if section_data:
+                writer.writerow([header for header, _ in schema])
+                csv.DictWriter(f, fieldnames=[field for _, field in schema], restval='',
+                               extrasaction='ignore').writerows(section_data)
+        else:
+            writer.writerow(['Error:', section.get('error', 'No data')])
+        writer.writerow([])
+    
     def generate_csv_report(self, data: Dict, output_file: str):
         """
         Generate a comprehensive CSV report from DORA metrics data.
@@ -418,7 +703,7 @@ class DataSightDORAFetcher:
             data: Dictionary containing all metrics data
             output_file: Output CSV file path
         """
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             writer.writerow(['DORA METRICS REPORT'])
@@ -429,118 +714,8 @@ class DataSightDORAFetcher:
             writer.writerow([])
             
             metrics = data['metrics']
-            
-            writer.writerow(['='*20 + ' RELEASE FREQUENCY ' + '='*20])
-            writer.writerow([])
-            if metrics['release_frequency']['status'] == 'success' and metrics['release_frequency']['data']:
-                rf_data = metrics['release_frequency']['data'].get('data', [])
-                if rf_data:
-                    writer.writerow(['Year-Month', 'Releases', 'Software Releases %', 'PDPTPPY (Calendar)', 
-                                   'PDPTPPY (Headcount)', 'Head Count', 'IT Head Count', 'Pods Count',
-                                   'L1 Teambook', 'L2 Teambook', 'L3 Teambook'])
-                    for record in rf_data:
-                        writer.writerow([
-                            record.get('yearMonth', ''),
-                            record.get('releases', ''),
-                            record.get('percent_software_releases', ''),
-                            record.get('pdptppy_calendar_days', ''),
-                            record.get('pdptppy_full_headcount_basis', ''),
-                            record.get('head_count', ''),
-                            record.get('it_head_count', ''),
-                            record.get('pods_count', ''),
-                            record.get('l1_teambook', ''),
-                            record.get('l2_teambook', ''),
-                            record.get('l3_teambook', '')
-                        ])
-            else:
-                writer.writerow(['Error:', metrics['release_frequency'].get('error', 'No data')])
-            writer.writerow([])
-            
-            writer.writerow(['='*20 + ' LEAD TIME TO DEPLOY (LTTD) ' + '='*20])
-            writer.writerow([])
-            if metrics['lttd']['status'] == 'success' and metrics['lttd']['data']:
-                lttd_data = metrics['lttd']['data'].get('data', [])
-                if lttd_data:
-                    writer.writerow(['Year-Month', 'LTTD (days)', 'Highest LTTD', 'CRs with LTTD', 
-                                   'Eligible CRs', 'CRs with LTTD %', 'Pods with CRs', 'Pods with LTTD',
-                                   'Pods with LTTD < Week', 'Pods with LTTD < Week %',
-                                   'L1 Teambook', 'L2 Teambook', 'L3 Teambook', 'Agg Key'])
-                    for record in lttd_data:
-                        writer.writerow([
-                            record.get('yearMonth', ''),
-                            record.get('lttd', ''),
-                            record.get('highest_lttd', ''),
-                            record.get('crs_with_lttd', ''),
-                            record.get('eligible_crs', ''),
-                            record.get('percent_crs_with_lttd', ''),
-                            record.get('pods_with_crs', ''),
-                            record.get('pods_with_lttd', ''),
-                            record.get('pods_with_lttd_less_than_week', ''),
-                            record.get('percent_pods_with_lttd_less_than_week', ''),
-                            record.get('l1_teambook', ''),
-                            record.get('l2_teambook', ''),
-                            record.get('l3_teambook', ''),
-                            record.get('aggKey', '')
-                        ])
-            else:
-                writer.writerow(['Error:', metrics['lttd'].get('error', 'No data')])
-            writer.writerow([])
-            
-            writer.writerow(['='*20 + ' MEAN TIME TO RECOVERY (MTTR) ' + '='*20])
-            writer.writerow([])
-            if metrics['mttr']['status'] == 'success' and metrics['mttr']['data']:
-                mttr_data = metrics['mttr']['data'].get('data', [])
-                if mttr_data:
-                    writer.writerow(['Year-Month', 'MTTR (hours)', 'MTTR CHM (hours)', 'Incidents Count', 
-                                   'Incidents Count CHM', 'Non-Incidents %',
-                                   'L1 Teambook', 'L2 Teambook', 'L3 Teambook', 'Agg Key'])
-                    for record in mttr_data:
-                        writer.writerow([
-                            record.get('yearMonth', ''),
-                            record.get('mttr', ''),
-                            record.get('mttr_chm', ''),
-                            record.get('incidents_count', ''),
-                            record.get('incidents_count_chm', ''),
-                            record.get('non_incidents_percent', ''),
-                            record.get('l1_teambook', ''),
-                            record.get('l2_teambook', ''),
-                            record.get('l3_teambook', ''),
-                            record.get('aggKey', '')
-                        ])
-            else:
-                writer.writerow(['Error:', metrics['mttr'].get('error', 'No data')])
-            writer.writerow([])
-            
-            writer.writerow(['='*20 + ' CHANGE FAILURE RATE (CFR) ' + '='*20])
-            writer.writerow([])
-            if metrics['cfr']['status'] == 'success' and metrics['cfr']['data']:
-                cfr_data = metrics['cfr']['data'].get('data', [])
-                if cfr_data:
-                    writer.writerow(['Year-Month', 'Change Failure Rate %', 'Change Causing Incident %', 
-                                   'Change with Business Impact %', 'Releases', 'Change Failed',
-                                   'Change Causing Incident', 'Change with Business Impact',
-                                   'Pods Count', 'Pod IT HC',
-                                   'L1 Teambook', 'L2 Teambook', 'L3 Teambook', 'Agg Key'])
-                    for record in cfr_data:
-                        writer.writerow([
-                            record.get('yearMonth', ''),
-                            record.get('change_failure_rate', ''),
-                            record.get('percent_change_causing_incident', ''),
-                            record.get('percent_change_with_business_impact', ''),
-                            record.get('releases', ''),
-                            record.get('change_failed', ''),
-                            record.get('change_causing_incident', ''),
-                            record.get('change_with_business_impact', ''),
-                            record.get('num_of_pods_current_month', ''),
-                            record.get('pod_it_hc_current_month', ''),
-                            record.get('l1_teambook', ''),
-                            record.get('l2_teambook', ''),
-                            record.get('l3_teambook', ''),
-                            record.get('aggKey', '')
-                        ])
-            else:
-                writer.writerow(['Error:', metrics['cfr'].get('error', 'No data')])
-            writer.writerow([])
+            for title, metric_key, schema in CSV_SECTIONS:
+                self._write_section(f, title, schema, metrics[metric_key])
             
             if 'detailed_records' in data and data['detailed_records']:
                 writer.writerow(['='*20 + ' DETAILED LTTD RECORDS ' + '='*20])
@@ -550,21 +725,23 @@ class DataSightDORAFetcher:
                     if details['status'] == 'success' and details['data']:
                         detail_data = details['data'].get('data', [])
                         if detail_data:
-                            if detail_data:
-                                first_record = detail_data[0]
-                                headers = list(first_record.keys())
-                                writer.writerow(headers)
-                                for record in detail_data:
-                                    writer.writerow([record.get(h, '') for h in headers])
+                            headers = list(detail_data[0].keys())
+                            writer.writerow(headers)
+                            csv.DictWriter(f, fieldnames=headers, restval='',
+                                           extrasaction='ignore').writerows(detail_data)
                     writer.writerow([])
         
-        print(f"CSV report generated: {output_file}")
+        logger.info(f"CSV report generated: {output_file}")
     
     def save_to_json(self, data: Dict, output_file: str):
-        """Save results to JSON file."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        print(f"JSON data saved: {output_file}")
+        """Save results to JSON file (uses orjson when it is installed)."""
+        if orjson:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        logger.info(f"JSON data saved: {output_file}")
     
     def generate_filtered_lttd_csv(self, records: List[Dict], output_file: str):
         """
@@ -575,10 +752,10 @@ class DataSightDORAFetcher:
             output_file: Output CSV file path
         """
         if not records:
-            print("No records to export")
+            logger.info("No records to export")
             return
         
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             writer.writerow(['HIGH LTTD RECORDS REPORT - LTTD > 15 Days (Eligible Only)'])
@@ -586,56 +763,49 @@ class DataSightDORAFetcher:
             writer.writerow(['Total Records:', len(records)])
             writer.writerow([])
             
-            headers = [
-                'Month-Year',
-                'Change Reference',
-                'Start Date',
-                'Replica Item',
-                'Applicant Group',
-                'Assign Group',
-                'Report Group',
-                'DTT (17 Pod)',
-                'Requested By',
-                'LTTD Days (Inc. Weekends-numeric)',
-                'CR Processing Hurdle',
-                'ICE CR Link',
-                'CR First Commit URL',
-                'Commits URL Call',
-                'Source Code Diff URL',
-                'CR First Commit Time',
-                'Actual End Date Time',
-                'Repo Link'
-            ]
-            writer.writerow(headers)
+            writer.writerow(['Month-Year'] + [header for header, _ in FILTERED_LTTD_SCHEMA])
             
-            for idx, record in enumerate(records, start=1):
-                month = record.get('month', '')
-                year = record.get('year', '')
-                month_year = f"{month}-{year}" if month and year else ''
-                
-                writer.writerow([
-                    month_year,
-                    record.get('id', ''),
-                    record.get('start_date', ''),
-                    record.get('short_description', ''),
-                    record.get('requested_by', ''),
-                    record.get('assignment_group', ''),
-                    record.get('l3_business_unit', ''),
-                    record.get('l4_business_unit', ''),
-                    record.get('requested_by', ''),
-                    record.get('lead_time_to_deploy_numeric_days', ''),
-                    record.get('cr_processing_hurdle', ''),
-                    record.get('ice_cr_link', ''),
-                    record.get('cr_first_commit_url', ''),
-                    record.get('commits_url_call', ''),
-                    record.get('source_code_diff_URL', ''),
-                    record.get('cr_first_commit_time', ''),
-                    record.get('actual_end_date_time', ''),
-                    record.get('repo_link', '')
-                ])
-        
-        print(f"\nFiltered LTTD CSV report generated: {output_file}")
-        print(f"Total records exported: {len(records)}")
+            fields = [field for _, field in FILTERED_LTTD_SCHEMA]
+            
+            def rows():
+                for record in records:
+                    get = record.get
+                    month, year = get('month', ''), get('year', '')
+                    yield [f"{month}-{year}" if month and year else ''] + [get(field, '') for field in fields]
+            
+            writer.writerows(rows())
+        
+        logger.info(f"\nFiltered LTTD CSV report generated: {output_file}\n"
+                    f"Total records exported: {len(records)}")
+
+
+def _load_config(config_file: str) -> Dict:
+    """
+    Load a JSON config file.
+    
+    Args:
+        config_file: Path to the config file
+        
+    Returns:
+        Parsed configuration dictionary
+    """
+    with open(config_file, 'rb') as f:
+        content = f.read()
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
+def _normalize_teambook_ids(teambook_ids: str) -> str:
+    """
+    Normalize a comma-separated teambook ID list for a single batched API request.
+    
+    Args:
+        teambook_ids: Teambook IDs as entered (e.g., "5449, 5450,5449")
+        
+    Returns:
+        Comma-separated IDs with whitespace, blanks and duplicates removed (e.g., "5449,5450")
+    """
+    ids = (teambook_id.strip() for teambook_id in teambook_ids.split(','))
+    return ','.join(dict.fromkeys(teambook_id for teambook_id in ids if teambook_id))
 
 
 def main():
@@ -650,11 +820,10 @@ def main():
     
     if os.path.exists(config_file):
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-                base_url = config.get('base_url')
-                bearer_token = config.get('bearer_token')
-                print(f"✓ Loaded configuration from {config_file}")
+            config = _load_config(config_file)
+            base_url = config.get('base_url')
+            bearer_token = config.get('bearer_token')
+            print(f"✓ Loaded configuration from {config_file}")
         except Exception as e:
             print(f"⚠ Warning: Could not read config file: {e}")
     
@@ -677,13 +846,27 @@ def main():
         print("\n❌ Error: base_url and bearer_token are required!")
         return
     
+    max_workers = MAX_DETAIL_WORKERS
+    max_workers_env = os.getenv('DATASIGHT_MAX_WORKERS')
+    if max_workers_env is not None:
+        try:
+            max_workers = int(max_workers_env.strip())
+        except ValueError:
+            max_workers = 0
+        if max_workers < 1:
+            print(f"⚠ Warning: DATASIGHT_MAX_WORKERS must be a positive integer, "
+                  f"got {max_workers_env!r}; using {MAX_DETAIL_WORKERS}")
+            max_workers = MAX_DETAIL_WORKERS
+    
     print("\n" + "-"*80)
     print("Enter DORA Metrics Parameters")
     print("-"*80)
     
     from_date = input("\nStart date (YYYY-MM format, e.g., 2025-09): ").strip()
     to_date = input("End date (YYYY-MM format, e.g., 2025-10): ").strip()
-    teambook_ids = input("Teambook IDs (comma-separated, e.g., 5449 or 5449,5450): ").strip()
+    teambook_ids = _normalize_teambook_ids(
+        input("Teambook IDs (comma-separated, e.g., 5449 or 5449,5450): ")
+    )
     
     while True:
         try:
@@ -703,7 +886,9 @@ def main():
     
     report_type = input("\nSelect report type (1 or 2): ").strip()
     
-    fetcher = DataSightDORAFetcher(base_url, bearer_token)
+    # DataSight responses are only written to disk when DATASIGHT_CACHE=1 is set
+    use_cache = os.getenv('DATASIGHT_CACHE', '').strip().lower() in ['1', 'true', 'yes']
+    cache_dir = DEFAULT_CACHE_DIR if use_cache else None
     
     if report_type == '2':
         min_lttd = input("Minimum LTTD days threshold (default: 15): ").strip()
@@ -731,15 +916,17 @@ def main():
             print("Operation cancelled.")
             return
         
-        filtered_records = fetcher.fetch_filtered_lttd_records(
-            from_date=from_date,
-            to_date=to_date,
-            teambook_ids=teambook_ids,
-            teambook_level=teambook_level,
-            min_lttd_days=min_lttd_days
-        )
-        
-        fetcher.generate_filtered_lttd_csv(filtered_records, output_file)
+        with DataSightDORAFetcher(base_url, bearer_token, cache_dir=cache_dir,
+                                  max_workers=max_workers) as fetcher:
+            filtered_records = fetcher.fetch_filtered_lttd_records(
+                from_date=from_date,
+                to_date=to_date,
+                teambook_ids=teambook_ids,
+                teambook_level=teambook_level,
+                min_lttd_days=min_lttd_days
+            )
+            
+            fetcher.generate_filtered_lttd_csv(filtered_records, output_file)
         
     else:
         fetch_details_input = input("\nFetch detailed records using aggregation keys? (y/n, default: n): ").strip().lower()
@@ -770,19 +957,23 @@ def main():
             print("Operation cancelled.")
             return
         
-        results = fetcher.fetch_all_metrics(
-            from_date=from_date,
-            to_date=to_date,
-            teambook_ids=teambook_ids,
-            teambook_level=teambook_level,
-            fetch_details=fetch_details
-        )
-        
-        fetcher.generate_csv_report(results, output_file)
-        
-        if json_output:
-            fetcher.save_to_json(results, json_output)
+        with DataSightDORAFetcher(base_url, bearer_token, cache_dir=cache_dir,
+                                  max_workers=max_workers) as fetcher:
+            results = fetcher.fetch_all_metrics(
+                from_date=from_date,
+                to_date=to_date,
+                teambook_ids=teambook_ids,
+                teambook_level=teambook_level,
+                fetch_details=fetch_details
+            )
+            
+            fetcher.generate_csv_report(results, output_file)
+            
+            if json_output:
+                fetcher.save_to_json(results, json_output)
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler(sys.stdout)],
+                        format='%(message)s')
     main()